@@ -170,6 +170,9 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         Shutdown the agent and close all MCP server connections.
         NOTE: This method is called automatically when the agent is used as an async context manager.
         """
+        # Cached responses must not outlive the MCP connections they were produced with
+        if self._llm and hasattr(self._llm, "clear_response_cache"):
+            self._llm.clear_response_cache()
         await super().close()
 
     async def __call__(
@@ -418,7 +421,7 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         except Exception as e:
             import traceback
 
-            print(f"Error in _call_human_input_tool: {traceback.format_exc()}")
+            self.logger.error(f"Error in _call_human_input_tool: {traceback.format_exc()}")
 
             return CallToolResult(
                 isError=True,
@@ -90,8 +90,9 @@ class ChainAgent(BaseAgent):
         request_text = f"<fastagent:request>{user_message.all_text()}</fastagent:request>"
         final_results.append(request_text)
 
-        # Process through each agent in sequence
-        for i, agent in enumerate(self.agents):
+        # Process through each agent in sequence. This cannot be fanned out concurrently:
+        # every agent receives the responses of the agents before it.
+        for agent in self.agents:
             # In cumulative mode, include the original message and all previous responses
             chain_messages = multipart_messages.copy()
             chain_messages.extend(all_responses)
@@ -106,9 +107,6 @@ class ChainAgent(BaseAgent):
             )
             final_results.append(attributed_response)
 
-            if i < len(self.agents) - 1:
-                [Prompt.user(current_response.all_text())]
-
         # For cumulative mode, return the properly formatted output with XML tags
         response_text = "\n\n".join(final_results)
         return PromptMessageMultipart(
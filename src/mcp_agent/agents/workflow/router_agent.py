@@ -36,7 +36,9 @@ Follow these guidelines:
 - Provide your confidence level (high, medium, low) and brief reasoning for your selection
 """
 
-# Default routing instruction with placeholders for context and request
+# Default routing instruction with placeholders for context and request.
+# The request is placed last so the static agents/instruction text forms a stable prefix
+# that provider-side prompt caching can reuse between routing calls.
 DEFAULT_ROUTING_INSTRUCTION = """
 You are a highly accurate request router that directs incoming requests to the most appropriate agent.
 
@@ -44,10 +46,6 @@ You are a highly accurate request router that directs incoming requests to the m
 <fastagent:agents>
 {context}
 </fastagent:agents>
-
-<fastagent:request>
-{request}
-</fastagent:request>
 </fastagent:data>
 
 Your task is to analyze the request and determine the most appropriate agent from the options above.
@@ -77,6 +75,10 @@ Respond with JSON following the schema below:
 Supply only the JSON with no preamble. Use "reasoning" field to describe actions. NEVER EMIT CODE FENCES. 
 
 </fastagent:instruction>
+
+<fastagent:request>
+{request}
+</fastagent:request>
 """
 
 
@@ -139,6 +141,13 @@ class RouterAgent(BaseAgent):
         self.routing_instruction = routing_instruction
         self.agent_map = {agent.name: agent for agent in agents}
 
+        # Agent descriptions don't change between requests, so build the routing context once
+        agent_descriptions = []
+        for i, agent in enumerate(self.agents, 1):
+            description = agent.instruction if isinstance(agent.instruction, str) else ""
+            agent_descriptions.append(f"{i}. Name: {agent.name} - {description}")
+        self._routing_context = "\n\n".join(agent_descriptions)
+
         # Set up base router request parameters
         base_params = {"systemPrompt": ROUTING_SYSTEM_INSTRUCTION, "use_history": False}
 
@@ -292,17 +301,9 @@ class RouterAgent(BaseAgent):
                 result=self.agents[0], confidence="high", reasoning="Only one agent available"
             )
 
-        # Generate agent descriptions for the context
-        agent_descriptions = []
-        for i, agent in enumerate(self.agents, 1):
-            description = agent.instruction if isinstance(agent.instruction, str) else ""
-            agent_descriptions.append(f"{i}. Name: {agent.name} - {description}")
-
-        context = "\n\n".join(agent_descriptions)
-
         # Format the routing prompt
         routing_instruction = self.routing_instruction or DEFAULT_ROUTING_INSTRUCTION
-        prompt_text = routing_instruction.format(context=context, request=request)
+        prompt_text = routing_instruction.format(context=self._routing_context, request=request)
 
         # Create multipart message for the router
         prompt = PromptMessageMultipart(
@@ -97,6 +97,8 @@ class AgentApp:
                 raise ValueError(f"Agent '{agent_name}' not found")
             return self._agents[agent_name]
 
+        if not self._agents:
+            raise ValueError("No agents available")
         return next(iter(self._agents.values()))
 
     async def apply_prompt(
@@ -242,6 +244,8 @@ class AgentApp:
             target_name = agent
         else:
             # Use the first agent's name as default
+            if not self._agents:
+                raise ValueError("No agents available")
             target_name = next(iter(self._agents.keys()))
 
         # Don't delegate to the agent's own prompt method - use our implementation
@@ -34,6 +34,12 @@ class RequestParams(CreateMessageRequestParams):
     Include the message history in the generate request.
     """
 
+    response_cache_ttl: float | None = None
+    """
+    Seconds to reuse the response for an identical prompt and parameters.
+    Only applies when use_history is False. Disabled when None.
+    """
+
     max_iterations: int = 10
     """
     The maximum number of iterations to run the LLM for.
@@ -1,7 +1,8 @@
 """Module for converting log events to progress events."""
 
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
 from pydantic import BaseModel
 
@@ -25,6 +26,10 @@ class ProgressAction(str, Enum):
     FATAL_ERROR = "Error"
 
 
+# Action labels padded for display, computed once rather than per event
+_PADDED_ACTIONS = {action: action.value.ljust(11) for action in ProgressAction}
+
+
 class ProgressEvent(BaseModel):
     """Represents a progress event converted from a log event."""
 
@@ -35,12 +40,47 @@ class ProgressEvent(BaseModel):
 
     def __str__(self) -> str:
         """Format the progress event for display."""
-        base = f"{self.action.ljust(11)}. {self.target}"
-        if self.details:
-            base += f" - {self.details}"
+        parts = []
         if self.agent_name:
-            base = f"[{self.agent_name}] {base}"
-        return base
+            parts += ("[", self.agent_name, "] ")
+        parts += (_PADDED_ACTIONS[self.action], ". ", self.target)
+        if self.details:
+            parts += (" - ", self.details)
+        return "".join(parts)
+
+
+def _aggregator_details(event_data: dict) -> str:
+    """Format details for MCP aggregator events, e.g. fetch (fetch)."""
+    server_name = event_data.get("server_name", "")
+    tool_name = event_data.get("tool_name")
+    if tool_name:
+        return f"{server_name} ({tool_name})"
+    return f"{server_name}"
+
+
+def _llm_details(event_data: dict) -> str:
+    """Format details for LLM events, e.g. gpt-4o turn 2."""
+    model = event_data.get("model", "")
+    chat_turn = event_data.get("chat_turn")
+    if chat_turn is not None:
+        return f"{model} turn {chat_turn}"
+    return f"{model}"
+
+
+# Namespace fragments (checked in order) and the function that formats their details
+_NAMESPACE_DETAILS: tuple[tuple[str, Callable[[dict], str]], ...] = (
+    ("mcp_aggregator", _aggregator_details),
+    ("augmented_llm", _llm_details),
+)
+
+
+@lru_cache(maxsize=256)
+def _details_handler(namespace: str) -> Optional[Callable[[dict], str]]:
+    """Find the details formatter for a namespace. Namespaces repeat, so results are cached."""
+    for fragment, handler in _NAMESPACE_DETAILS:
+        if fragment in namespace:
+            return handler
+    return None
 
 
 def convert_log_event(event: Event) -> Optional[ProgressEvent]:
@@ -60,35 +100,19 @@ def convert_log_event(event: Event) -> Optional[ProgressEvent]:
 
     # Build target string based on the event type.
     # Progress display is currently [time] [event] --- [target] [details]
-    namespace = event.namespace
     agent_name = event_data.get("agent_name")
-    target = agent_name
+    target = agent_name or event_data.get("target", "unknown")
     details = ""
     if progress_action == ProgressAction.FATAL_ERROR:
         details = event_data.get("error_message", "An error occurred")
-    elif "mcp_aggregator" in namespace:
-        server_name = event_data.get("server_name", "")
-        tool_name = event_data.get("tool_name")
-        if tool_name:
-            # fetch(fetch)
-            details = f"{server_name} ({tool_name})"
-        else:
-            details = f"{server_name}"
-
-    elif "augmented_llm" in namespace:
-        model = event_data.get("model", "")
-
-        details = f"{model}"
-        chat_turn = event_data.get("chat_turn")
-        if chat_turn is not None:
-            details = f"{model} turn {chat_turn}"
     else:
-        if not target:
-            target = event_data.get("target", "unknown")
+        details_handler = _details_handler(event.namespace)
+        if details_handler:
+            details = details_handler(event_data)
 
     return ProgressEvent(
         action=ProgressAction(progress_action),
         target=target,
         details=details,
-        agent_name=event_data.get("agent_name"),
+        agent_name=agent_name,
     )
@@ -1,4 +1,7 @@
+import time
 from abc import abstractmethod
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,7 +21,7 @@ from mcp.types import (
     PromptMessage,
     TextContent,
 )
-from pydantic_core import from_json
+from pydantic_core import PydanticSerializationError, from_json
 from rich.text import Text
 
 from mcp_agent.context_dependent import ContextDependent
@@ -56,6 +59,9 @@ if TYPE_CHECKING:
 # TODO -- move this to a constant
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
 
+# Maximum number of responses retained per LLM when response caching is enabled
+RESPONSE_CACHE_SIZE = 128
+
 
 class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT, MessageT]):
     """
@@ -112,6 +118,11 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
 
         self._message_history: List[PromptMessageMultipart] = []
 
+        # Responses keyed by prompt/params digest, with their expiry (see RequestParams.response_cache_ttl)
+        self._response_cache: OrderedDict[bytes, Tuple[float, PromptMessageMultipart]] = (
+            OrderedDict()
+        )
+
         # Initialize the display component
         self.display = ConsoleDisplay(config=self.context.config)
 
@@ -189,13 +200,85 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
                 chat_turn=self.chat_turn(),
             )
 
-        assistant_response: PromptMessageMultipart = await self._apply_prompt_provider_specific(
-            multipart_messages, request_params
-        )
+        # Only merge params when caching could apply; providers do their own merge
+        cache_key, cache_ttl = None, None
+        if (
+            request_params and request_params.response_cache_ttl
+        ) or self.default_request_params.response_cache_ttl:
+            params = self.get_request_params(request_params)
+            cache_key = self._response_cache_key(multipart_messages, params)
+            cache_ttl = params.response_cache_ttl
+
+        assistant_response = self._cached_response(cache_key)
+        if assistant_response is not None:
+            # Providers display their own replies; a cached reply must be shown here
+            await self.show_assistant_message(assistant_response.all_text())
+        else:
+            assistant_response = await self._apply_prompt_provider_specific(
+                multipart_messages, request_params
+            )
+            self._store_response(cache_key, assistant_response, cache_ttl)
 
         self._message_history.append(assistant_response)
         return assistant_response
 
+    def _response_cache_key(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        params: RequestParams,
+    ) -> bytes | None:
+        """Return the cache key for a request, or None if the request should not be cached"""
+        if not params.response_cache_ttl or params.use_history:
+            return None
+
+        digest = blake2b(digest_size=32)
+        try:
+            for message in multipart_messages:
+                digest.update(message.model_dump_json().encode())
+            digest.update(params.model_dump_json().encode())
+        except PydanticSerializationError as e:
+            # e.g. arbitrary objects in metadata - send the request uncached
+            self.logger.debug(f"{self.name}: Response not cacheable: {e}")
+            return None
+        return digest.digest()
+
+    def _cached_response(self, cache_key: bytes | None) -> PromptMessageMultipart | None:
+        """Return an unexpired cached response for the key, if there is one"""
+        if cache_key is None:
+            return None
+
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._response_cache[cache_key]
+            return None
+
+        self._response_cache.move_to_end(cache_key)
+        self.logger.debug(f"{self.name}: Using cached response")
+        return response.model_copy(deep=True)
+
+    def _store_response(
+        self,
+        cache_key: bytes | None,
+        response: PromptMessageMultipart,
+        ttl: float | None,
+    ) -> None:
+        """Cache a response, evicting the least recently used entry when full"""
+        if cache_key is None or not ttl:
+            return
+
+        self._response_cache[cache_key] = (time.monotonic() + ttl, response.model_copy(deep=True))
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self) -> None:
+        """Discard all cached responses"""
+        self._response_cache.clear()
+
     def chat_turn(self) -> int:
         """Return the current chat turn number"""
         return 1 + sum(1 for message in self._message_history if message.role == "assistant")
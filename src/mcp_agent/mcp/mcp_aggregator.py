@@ -77,12 +77,12 @@ class MCPAggregator(ContextDependent):
         # Keep a connection manager to manage persistent connections for this aggregator
         if self.connection_persistence:
             # Try to get existing connection manager from context
-            if not hasattr(self.context, "_connection_manager"):
-                self.context._connection_manager = MCPConnectionManager(
-                    self.context.server_registry
-                )
-                await self.context._connection_manager.__aenter__()
-            self._persistent_connection_manager = self.context._connection_manager
+            connection_manager = getattr(self.context, "_connection_manager", None)
+            if connection_manager is None:
+                connection_manager = MCPConnectionManager(self.context.server_registry)
+                self.context._connection_manager = connection_manager
+                await connection_manager.__aenter__()
+            self._persistent_connection_manager = connection_manager
 
         await self.load_servers()
 
@@ -137,13 +137,13 @@ class MCPAggregator(ContextDependent):
             try:
                 # Only attempt cleanup if we own the connection manager
                 if (
-                    hasattr(self.context, "_connection_manager")
-                    and self.context._connection_manager == self._persistent_connection_manager
+                    getattr(self.context, "_connection_manager", None)
+                    is self._persistent_connection_manager
                 ):
                     logger.info("Shutting down all persistent connections...")
                     await self._persistent_connection_manager.disconnect_all()
                     await self._persistent_connection_manager.__aexit__(None, None, None)
-                    delattr(self.context, "_connection_manager")
+                    self.context._connection_manager = None
                 self.initialized = False
             except Exception as e:
                 logger.error(f"Error during connection manager cleanup: {e}")
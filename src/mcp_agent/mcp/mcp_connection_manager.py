@@ -5,6 +5,7 @@ Manages the lifecycle of multiple MCP server connections.
 import asyncio
 import traceback
 from datetime import timedelta
+from functools import cache
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
@@ -39,6 +40,15 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@cache
+def _default_environment() -> Dict[str, str]:
+    """
+    The environment inherited by stdio servers, read once on first use.
+    Call _default_environment.cache_clear() to pick up changes to os.environ.
+    """
+    return get_default_environment()
+
+
 class ServerConnection:
     """
     Represents a long-lived MCP server connection, including:
@@ -80,16 +90,29 @@ class ServerConnection:
 
         # Track error state
         self._error_occurred = False
-        self._error_message = None
+        self._error: traceback.TracebackException | None = None
 
     def is_healthy(self) -> bool:
         """Check if the server connection is healthy and ready to use."""
         return self.session is not None and not self._error_occurred
 
+    def is_initializing(self) -> bool:
+        """Check if the server connection is still starting up."""
+        return not self._initialized_event.is_set()
+
     def reset_error_state(self) -> None:
         """Reset the error state, allowing reconnection attempts."""
         self._error_occurred = False
-        self._error_message = None
+        self._error = None
+
+    def error_message(self) -> list[str] | None:
+        """
+        Formatted traceback of the error that stopped the connection, if any.
+        Formatting is deferred until the details are actually reported.
+        """
+        if self._error is None:
+            return None
+        return list(self._error.format())
 
     def request_shutdown(self) -> None:
         """
@@ -173,14 +196,14 @@ async def _server_lifecycle_task(server_conn: ServerConnection) -> None:
     except Exception as exc:
         logger.error(
             f"{server_name}: Lifecycle task encountered an error: {exc}",
-            exc_info=True,
             data={
                 "progress_action": ProgressAction.FATAL_ERROR,
                 "server_name": server_name,
             },
         )
         server_conn._error_occurred = True
-        server_conn._error_message = traceback.format_exception(exc)
+        # Keep a frame-free snapshot; holding exc would keep this task's frames alive
+        server_conn._error = traceback.TracebackException.from_exception(exc, lookup_lines=False)
         # If there's an error, we should also set the event so that
         # 'get_server' won't hang
         server_conn._initialized_event.set()
@@ -244,7 +267,55 @@ class MCPConnectionManager(ContextDependent):
         Connect to a server and return a RunningServer instance that will persist
         until explicitly disconnected.
         """
-        # Create task group if it doesn't exist yet - make this method more resilient
+        await self._ensure_task_group(server_name)
+
+        async with self._lock:
+            # Check if already running
+            if server_name in self.running_servers:
+                return self.running_servers[server_name]
+
+            server_conn = self._start_server(server_name, client_session_factory, init_hook)
+
+        return server_conn
+
+    async def get_server(
+        self,
+        server_name: str,
+        client_session_factory: Callable,
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> ServerConnection:
+        """
+        Get a running server instance, launching it if needed.
+        """
+        await self._ensure_task_group(server_name)
+
+        # Look up, replace or launch the connection in a single critical section. A connection
+        # that is still initializing is shared with the caller that launched it.
+        async with self._lock:
+            server_conn = self.running_servers.get(server_name)
+            if server_conn and not server_conn.is_initializing() and not server_conn.is_healthy():
+                logger.info(f"{server_name}: Server exists but is unhealthy, recreating...")
+                server_conn.request_shutdown()
+                server_conn = None
+
+            if server_conn is None:
+                server_conn = self._start_server(server_name, client_session_factory, init_hook)
+
+        # Wait until it's fully initialized, or an error occurs
+        await server_conn.wait_for_initialized()
+
+        # Check if the server is healthy after initialization
+        if not server_conn.is_healthy():
+            error_msg = server_conn.error_message() or "Unknown error"
+            raise ServerInitializationError(
+                f"MCP Server: '{server_name}': Failed to initialize - see details. Check fastagent.config.yaml?",
+                error_msg,
+            )
+
+        return server_conn
+
+    async def _ensure_task_group(self, server_name: str) -> None:
+        """Create the task group if it doesn't exist yet - makes launching more resilient."""
         if not self._task_group_active:
             self._task_group = create_task_group()
             await self._task_group.__aenter__()
@@ -252,6 +323,19 @@ class MCPConnectionManager(ContextDependent):
             self._tg = self._task_group
             logger.info(f"Auto-created task group for server: {server_name}")
 
+    def _start_server(
+        self,
+        server_name: str,
+        client_session_factory: Callable[
+            [MemoryObjectReceiveStream, MemoryObjectSendStream, timedelta | None],
+            ClientSession,
+        ],
+        init_hook: Optional["InitHookCallable"] = None,
+    ) -> ServerConnection:
+        """
+        Create a server connection, register it and start its lifecycle task.
+        Must be called with self._lock held.
+        """
         config = self.server_registry.registry.get(server_name)
         if not config:
             raise ValueError(f"Server '{server_name}' not found in registry.")
@@ -263,7 +347,7 @@ class MCPConnectionManager(ContextDependent):
                 server_params = StdioServerParameters(
                     command=config.command,
                     args=config.args,
-                    env={**get_default_environment(), **(config.env or {})},
+                    env={**_default_environment(), **(config.env or {})},
                 )
                 # Create custom error handler to ensure all output is captured
                 error_handler = get_stderr_handler(server_name)
@@ -287,58 +371,12 @@ class MCPConnectionManager(ContextDependent):
             init_hook=init_hook or self.server_registry.init_hooks.get(server_name),
         )
 
-        async with self._lock:
-            # Check if already running
-            if server_name in self.running_servers:
-                return self.running_servers[server_name]
-
-            self.running_servers[server_name] = server_conn
-            self._tg.start_soon(_server_lifecycle_task, server_conn)
+        self.running_servers[server_name] = server_conn
+        self._tg.start_soon(_server_lifecycle_task, server_conn)
 
         logger.info(f"{server_name}: Up and running with a persistent connection!")
         return server_conn
 
-    async def get_server(
-        self,
-        server_name: str,
-        client_session_factory: Callable,
-        init_hook: Optional["InitHookCallable"] = None,
-    ) -> ServerConnection:
-        """
-        Get a running server instance, launching it if needed.
-        """
-        # Get the server connection if it's already running and healthy
-        async with self._lock:
-            server_conn = self.running_servers.get(server_name)
-            if server_conn and server_conn.is_healthy():
-                return server_conn
-
-            # If server exists but isn't healthy, remove it so we can create a new one
-            if server_conn:
-                logger.info(f"{server_name}: Server exists but is unhealthy, recreating...")
-                self.running_servers.pop(server_name)
-                server_conn.request_shutdown()
-
-        # Launch the connection
-        server_conn = await self.launch_server(
-            server_name=server_name,
-            client_session_factory=client_session_factory,
-            init_hook=init_hook,
-        )
-
-        # Wait until it's fully initialized, or an error occurs
-        await server_conn.wait_for_initialized()
-
-        # Check if the server is healthy after initialization
-        if not server_conn.is_healthy():
-            error_msg = server_conn._error_message or "Unknown error"
-            raise ServerInitializationError(
-                f"MCP Server: '{server_name}': Failed to initialize - see details. Check fastagent.config.yaml?",
-                error_msg,
-            )
-
-        return server_conn
-
     async def get_server_capabilities(self, server_name: str) -> ServerCapabilities | None:
         """Get the capabilities of a specific server."""
         server_conn = await self.get_server(
@@ -362,8 +400,9 @@ class MCPConnectionManager(ContextDependent):
 
     async def disconnect_all(self) -> None:
         """Disconnect all servers that are running under this connection manager."""
-        # Get a copy of servers to shutdown
-        servers_to_shutdown = []
+        # Skip taking the lock when there is nothing to disconnect (e.g. repeated teardown)
+        if not self.running_servers:
+            return
 
         async with self._lock:
             if not self.running_servers:
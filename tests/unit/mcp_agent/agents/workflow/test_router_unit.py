@@ -110,3 +110,22 @@ async def test_single_agent_shortcircuit():
     assert routing_result.result.name == "only_agent"
     assert routing_result.confidence == "high"
     assert "Only one agent available" in routing_result.reasoning
+
+
+@pytest.mark.asyncio
+async def test_routing_prompt_places_request_last():
+    """Test the routing prompt keeps a stable prefix with the request at the end."""
+    agent1 = Agent(config=AgentConfig(name="agent1", instruction="Test agent 1"))
+    agent2 = Agent(config=AgentConfig(name="agent2", instruction="Test agent 2"))
+    router = RouterAgent(config=AgentConfig(name="router"), agents=[agent1, agent2])
+    router._llm = PassthroughLLM()
+
+    await router._route_request("first request")
+    await router._route_request("second request")
+
+    first, second = router._llm._message_history[0], router._llm._message_history[2]
+    first_text, second_text = first.first_text(), second.first_text()
+    prefix = first_text.split("first request")[0]
+    assert second_text.startswith(prefix)
+    assert "agent1" in prefix and "agent2" in prefix
+    assert second_text.rstrip().endswith("second request\n</fastagent:request>")
@@ -1,8 +1,11 @@
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
 
 from mcp_agent.core.prompt import Prompt
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm import augmented_llm
 from mcp_agent.llm.augmented_llm_passthrough import (
     CALL_TOOL_INDICATOR,
     FIXED_RESPONSE_INDICATOR,
@@ -85,4 +88,109 @@ async def test_parse_tool_call_with_args():
     assert "value" == args["arg"]
 
 
+@pytest.mark.asyncio
+async def test_response_cache_reuses_identical_stateless_request():
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    cached = RequestParams(use_history=False, response_cache_ttl=60)
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "cache me" == response.first_text()
+
+    # Changes the passthrough output for all later (uncached) requests
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "cache me" == response.first_text()
+
+    response = await llm.generate([Prompt.user("cache me")], RequestParams(use_history=False))
+    assert "foo" == response.first_text()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_ignored_when_history_enabled():
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    params = RequestParams(use_history=True, response_cache_ttl=60)
+    await llm.generate([Prompt.user("cache me")], params)
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+
+    response = await llm.generate([Prompt.user("cache me")], params)
+    assert "foo" == response.first_text()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_entry_expires_after_ttl(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(augmented_llm, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    cached = RequestParams(use_history=False, response_cache_ttl=10)
+    await llm.generate([Prompt.user("cache me")], cached)
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+
+    clock.now = 109.0
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "cache me" == response.first_text()
+
+    clock.now = 111.0
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "foo" == response.first_text()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(augmented_llm, "RESPONSE_CACHE_SIZE", 2)
+
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    cached = RequestParams(use_history=False, response_cache_ttl=60)
+    await llm.generate([Prompt.user("first")], cached)
+    await llm.generate([Prompt.user("second")], cached)
+    # Touch "first" so that "second" is the least recently used entry
+    await llm.generate([Prompt.user("first")], cached)
+    await llm.generate([Prompt.user("third")], cached)
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+
+    assert "first" == (await llm.generate([Prompt.user("first")], cached)).first_text()
+    assert "third" == (await llm.generate([Prompt.user("third")], cached)).first_text()
+    assert "foo" == (await llm.generate([Prompt.user("second")], cached)).first_text()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_cleared():
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    cached = RequestParams(use_history=False, response_cache_ttl=60)
+    await llm.generate([Prompt.user("cache me")], cached)
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+
+    llm.clear_response_cache()
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "foo" == response.first_text()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_hit_is_displayed(monkeypatch):
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    shown = []
+
+    async def show_assistant_message(message_text, *args, **kwargs):
+        shown.append(message_text)
+
+    monkeypatch.setattr(llm, "show_assistant_message", show_assistant_message)
+    cached = RequestParams(use_history=False, response_cache_ttl=60)
+    await llm.generate([Prompt.user("cache me")], cached)
+    await llm.generate([Prompt.user("cache me")], cached)
+
+    assert ["cache me", "cache me"] == shown
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_unserializable_params():
+    llm: AugmentedLLMProtocol = PassthroughLLM()
+    cached = RequestParams(use_history=False, response_cache_ttl=60, metadata={"k": object()})
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "cache me" == response.first_text()
+
+    await llm.generate([Prompt.user(f"{FIXED_RESPONSE_INDICATOR} foo")])
+    response = await llm.generate([Prompt.user("cache me")], cached)
+    assert "foo" == response.first_text()
+
+
 # actual tool calling is covered in the integration tests
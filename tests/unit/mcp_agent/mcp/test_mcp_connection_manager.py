@@ -0,0 +1,129 @@
+"""
+Unit tests for MCPConnectionManager server startup, using a fake transport and session.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.config import MCPServerSettings
+from mcp_agent.core.exceptions import ServerInitializationError
+from mcp_agent.mcp import mcp_connection_manager
+from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+
+
+class FakeSession:
+    """Stands in for a ClientSession; initialize waits on a gate and can be made to fail."""
+
+    def __init__(self, gate: asyncio.Event, fail: bool) -> None:
+        self._gate = gate
+        self._fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def initialize(self):
+        await self._gate.wait()
+        if self._fail:
+            raise RuntimeError("initialize failed")
+        return SimpleNamespace(capabilities=None)
+
+
+class FakeSessionFactory:
+    """Records every session created; the first `failures` sessions fail to initialize."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.gate = asyncio.Event()
+        self.sessions: list[FakeSession] = []
+        self._failures = failures
+
+    def __call__(self, read_stream, send_stream, read_timeout) -> FakeSession:
+        session = FakeSession(self.gate, fail=len(self.sessions) < self._failures)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def transport_ready(monkeypatch) -> asyncio.Event:
+    """Patch the stdio transport so it stays connecting until the returned event is set."""
+    ready = asyncio.Event()
+
+    @asynccontextmanager
+    async def stdio_client(server_params, errlog=None):
+        await ready.wait()
+        yield None, None
+
+    monkeypatch.setattr(mcp_connection_manager, "stdio_client", stdio_client)
+    return ready
+
+
+def _registry() -> SimpleNamespace:
+    servers = {"fake": MCPServerSettings(command="fake", args=[])}
+    return SimpleNamespace(registry=servers, init_hooks={})
+
+
+async def _settle() -> None:
+    """Let started tasks run until they block."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_server_builds_one_session(transport_ready):
+    factory = FakeSessionFactory()
+    async with MCPConnectionManager(_registry()) as manager:
+        tasks = [asyncio.create_task(manager.get_server("fake", factory)) for _ in range(3)]
+        await _settle()
+        transport_ready.set()
+        factory.gate.set()
+        first, second, third = await asyncio.gather(*tasks)
+
+        assert 1 == len(factory.sessions)
+        assert first is second is third
+
+
+@pytest.mark.asyncio
+async def test_initializing_connection_is_not_recreated(transport_ready):
+    factory = FakeSessionFactory()
+    async with MCPConnectionManager(_registry()) as manager:
+        first_task = asyncio.create_task(manager.get_server("fake", factory))
+        await _settle()
+        # The transport is still connecting, so no session has been created yet
+        assert 0 == len(factory.sessions)
+        launching = manager.running_servers["fake"]
+
+        second_task = asyncio.create_task(manager.get_server("fake", factory))
+        await _settle()
+        assert launching is manager.running_servers["fake"]
+
+        # Once connected, callers keep waiting until the session is initialized
+        transport_ready.set()
+        await _settle()
+        assert 1 == len(factory.sessions)
+        assert not first_task.done() and not second_task.done()
+
+        factory.gate.set()
+        assert launching is await first_task
+        assert launching is await second_task
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_is_recreated_on_next_call(transport_ready):
+    factory = FakeSessionFactory(failures=1)
+    transport_ready.set()
+    factory.gate.set()
+    async with MCPConnectionManager(_registry()) as manager:
+        with pytest.raises(ServerInitializationError) as exc_info:
+            await manager.get_server("fake", factory)
+        assert "RuntimeError: initialize failed" in str(exc_info.value)
+
+        server_conn = await manager.get_server("fake", factory)
+
+        assert 2 == len(factory.sessions)
+        assert server_conn.is_healthy()
+        assert server_conn is manager.running_servers["fake"]
@@ -10,6 +10,9 @@ from rich import print
 from rich.console import Console
 from rich.syntax import Syntax
 
+from mcp_agent.event_progress import ProgressAction, ProgressEvent, convert_log_event
+from mcp_agent.logging.events import Event
+
 # Create console with fixed width
 console = Console(width=100, force_terminal=True)
 
@@ -80,6 +83,66 @@ def test_event_conversion():
         # ), "Event summary output does not match expected output (see diff above)"
 
 
+def test_progress_event_str_pads_action():
+    """Test progress events are formatted with a fixed width action column."""
+    event = ProgressEvent(action=ProgressAction.READY, target="server")
+    assert "Ready      . server" == str(event)
+
+    event = ProgressEvent(
+        action=ProgressAction.CALLING_TOOL, target="agent", details="fetch", agent_name="agent"
+    )
+    assert "[agent] Calling Tool. agent - fetch" == str(event)
+
+
+def _log_event(namespace: str, **data) -> Event:
+    return Event(type="info", namespace=namespace, message="test", data={"data": data})
+
+
+def test_convert_log_event_details_by_namespace():
+    """Test details are formatted according to the namespace of the log event."""
+    event = convert_log_event(
+        _log_event(
+            "mcp_agent.mcp.mcp_aggregator.agent",
+            progress_action=ProgressAction.CALLING_TOOL,
+            agent_name="agent",
+            server_name="fetch",
+            tool_name="fetch",
+        )
+    )
+    assert "fetch (fetch)" == event.details
+
+    event = convert_log_event(
+        _log_event(
+            "mcp_agent.llm.providers.augmented_llm_openai.agent",
+            progress_action=ProgressAction.CHATTING,
+            agent_name="agent",
+            model="gpt-4o",
+            chat_turn=2,
+        )
+    )
+    assert "gpt-4o turn 2" == event.details
+
+    assert None is convert_log_event(_log_event("mcp_agent.other", model="gpt-4o"))
+
+
+def test_convert_log_event_target_without_agent_name():
+    """Test events without an agent name fall back to the target, or "unknown"."""
+    event = convert_log_event(
+        _log_event(
+            "mcp_agent.mcp.mcp_aggregator",
+            progress_action=ProgressAction.STARTING,
+            server_name="fetch",
+        )
+    )
+    assert "unknown" == event.target
+    assert "fetch" == event.details
+
+    event = convert_log_event(
+        _log_event("mcp_agent.context", progress_action=ProgressAction.READY, target="app")
+    )
+    assert "app" == event.target
+
+
 def update_test_fixtures():
     """
     Utility method to update test fixtures with latest output.